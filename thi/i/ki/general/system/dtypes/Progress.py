@@ -1,7 +1,7 @@
-from dataclasses import dataclass, field
+import math
+from collections import deque
 from typing import Callable
 
-@dataclass(slots=True)
 class ProgressCheck:
     """
     Fortschrittsprüfung für Annäherungsprozesse.
@@ -10,36 +10,70 @@ class ProgressCheck:
         Bei Aufruf liefert das Objekt (Callable) True, wenn das Ziel erreicht ist
         oder keine nennenswerte Annäherung mehr messbar ist.
 
+    Stagnation:
+        Bewertet wird der Mittelwert der letzten `fenster` Verbesserungen
+        (gleitendes Fenster), nicht ein einzelner Messschritt. Rauschen führt so
+        nicht zu vorzeitigem Abbruch; vor vollem Fenster gilt keine Stagnation.
+
     Parameter:
         rest: Funktion, die den aktuellen Restwert (z.B.: Restweg) liefert.
         ziel: Zielschwelle; bei rest() ≤ ziel gilt „erreicht“.
         eps_abs: minimale absolute Verbesserung pro Messung.
         eps_rel: minimale relative Verbesserung pro Messung
                  (bezogen auf den letzten Restwert).
+        fenster: Anzahl der Messungen im gleitenden Fenster (≥ 1).
 
     Rückgabe (__call__):
         True = „fertig“ (Ziel erreicht oder Stagnation), sonst False.
+
+    Hinweis:
+        Schlichte Klasse mit `__slots__` statt Dataclass; `__call__` liest die
+        Felder einmalig in lokale Variablen (Aufruf im Abfragetakt).
     """
 
-    rest: Callable[[], float]
-    ziel: float
-    eps_abs: float = 1e-3
-    eps_rel: float = 1e-3
-    rest_alt: float = field(init=False)
+    __slots__ = ("rest", "ziel", "eps_abs", "eps_rel", "fenster", "rest_alt", "_deltas", "_floor_min", "_floor")
 
-    def __post_init__(self) -> None:
+    def __init__(
+        self,
+        rest: Callable[[], float],
+        ziel: float,
+        eps_abs: float = 1e-3,
+        eps_rel: float = 1e-3,
+        fenster: int = 8,
+    ) -> None:
         """Initialisiert den Vergleichswert aus der ersten Messung."""
-        self.rest_alt = self.rest()
+        if fenster < 1:
+            raise ValueError("fenster muss ≥ 1 sein")
+
+        self.rest = rest
+        self.ziel = ziel
+        self.eps_abs = eps_abs
+        self.eps_rel = eps_rel
+        self.fenster = fenster
+        self.rest_alt: float = rest()
+        self._deltas: deque[float] = deque(maxlen=fenster)
+        # Untergrenze für rest_alt ≤ 1.0 (Klemmung) ist über die Lebensdauer konstant
+        self._floor_min: float = max(eps_abs, eps_rel)
+        self._floor: float = max(eps_abs, eps_rel * self.rest_alt) if self.rest_alt > 1.0 else self._floor_min
+
+    def __repr__(self) -> str:
+        return (
+            f"ProgressCheck(ziel={self.ziel!r}, eps_abs={self.eps_abs!r}, "
+            f"eps_rel={self.eps_rel!r}, fenster={self.fenster!r}, rest_alt={self.rest_alt!r})"
+        )
 
     def __call__(self) -> bool:
         """
         Prüft den Zustand.
-        True, wenn `rest() ≤ ziel` oder der Fortschritt kleiner ist als
-        max(eps_abs, eps_rel · max(rest_alt, 1.0)).
+        True, wenn `rest() ≤ ziel` oder der mittlere Fortschritt im vollen Fenster
+        kleiner ist als max(eps_abs, eps_rel · max(rest_alt, 1.0)).
         """
         rest_neu = self.rest()
-        # Mindestfortschritt: absolut oder relativ zum letzten Restwert
-        min_fortschritt = max(self.eps_abs, self.eps_rel * max(self.rest_alt, 1.0))
-        stagniert = (self.rest_alt - rest_neu) <= min_fortschritt
+        fenster = self.fenster
+        deltas = self._deltas
+        deltas.append(self.rest_alt - rest_neu)
+        # Mindestfortschritt: absolut oder relativ zum letzten Restwert (vorberechnet)
+        stagniert = len(deltas) == fenster and math.fsum(deltas) / fenster <= self._floor
         self.rest_alt = rest_neu
-        return (rest_neu <= self.ziel) or stagniert
\ No newline at end of file
+        self._floor = max(self.eps_abs, self.eps_rel * rest_neu) if rest_neu > 1.0 else self._floor_min
+        return (rest_neu <= self.ziel) or stagniert
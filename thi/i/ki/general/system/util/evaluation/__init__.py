@@ -26,7 +26,8 @@ Funktionen. Interne Hilfsfunktionen bleiben verborgen.
 from .input_utils import read_input
 from .type_utils import TypeUtils
 
-# Paket-API: bereitstellen eines funktionsartigen Aliases
+# Paket-API: bereitstellen funktionsartiger Aliase
 eps = TypeUtils.eps
+eps_array = TypeUtils.eps_array
 
-__all__ = ["read_input", "eps"]
\ No newline at end of file
+__all__ = ["read_input", "eps", "eps_array"]
\ No newline at end of file
@@ -31,11 +31,11 @@ MERKMALE
 HINWEISE
 --------
 Alle Funktionen blockieren bis zur gültigen Eingabe.
-Boolesche Eingaben werden mit argparse-konformen Konvertern behandelt.
+Boolesche Eingaben werden über feste Wortmengen (true/false, yes/no, 1/0, …) konvertiert.
 """
 
 from __future__ import annotations
-import argparse
+from functools import lru_cache
 from typing import Collection, Callable, TypeVar, Final, Any, cast, final
 
 T = TypeVar("T")
@@ -72,8 +72,8 @@ class InputUtils:
     Öffentliche Schnittstelle
     -------------------------
     - `bool_converter(s: str) -> bool`
-      argparse‑basierte Umwandlung typischer Bool‑Eingaben ("true/false",
-      "yes/no", "1/0").
+      Umwandlung typischer Bool‑Eingaben ("true/false", "yes/no", "1/0",
+      "y/n", "t/f", "on/off") per Mengen‑Lookup.
     - `contains(haystack: Collection[str], needle: str, *, case_insensitive: bool = True) -> bool`
       Mitgliedschaftstest mit optionaler Groß‑/Kleinschreibungsignorierung.
       Casefolding wird nur angewandt, wenn **needle** und alle Elemente in
@@ -121,21 +121,22 @@ class InputUtils:
     def __new__(cls, *_, **__):  # pragma: no cover
         raise TypeError("InputUtils ist ein reiner Namespace und nicht instanziierbar")
 
-    # argparse-basierter Bool-Parser (identische Logik wie zuvor)
-    _BOOL_PARSER = argparse.ArgumentParser(add_help=False)
-    _BOOL_PARSER.add_argument('--flag', action=argparse.BooleanOptionalAction)
+    # Bool-Wortmengen (casefold-normalisiert)
+    _TRUE: Final[frozenset[str]] = frozenset({"true", "yes", "1", "y", "t", "on"})
+    _FALSE: Final[frozenset[str]] = frozenset({"false", "no", "0", "n", "f", "off"})
 
     @staticmethod
     def _bool_converter(s: str) -> bool:
         """
         Konvertiert typische boolesche Eingaben wie 'true', 'false', 'yes', 'no', '1', '0'.
+        Groß-/Kleinschreibung und umgebende Leerzeichen werden ignoriert.
         """
-
-        try:
-            parsed = InputUtils._BOOL_PARSER.parse_args(['--flag', s])
-            return parsed.flag
-        except Exception as e:  # noqa: BLE001
-            raise ValueError(f"Ungültiger boolescher Wert: {s}") from e
+        k: str = s.strip().casefold()
+        if k in InputUtils._TRUE:
+            return True
+        if k in InputUtils._FALSE:
+            return False
+        raise ValueError(f"Ungültiger boolescher Wert: {s}")
 
     @staticmethod
     def bool_converter(s: str) -> bool:
@@ -145,12 +146,40 @@ class InputUtils:
         return InputUtils._bool_converter(s)
 
     @staticmethod
-    def contains(haystack: Collection[str], needle: str, /, *, case_insensitive: bool = True) -> bool:
+    @lru_cache(maxsize=32)
+    def _folded(haystack: frozenset[str]) -> frozenset[str]:
+        """
+        Casefold-Menge einer unveränderlichen Whitelist (memoisiert).
+
+        Nur für Haystacks, die bereits `frozenset` sind (Hash wird im Objekt
+        zwischengespeichert); andere Collections werden nicht eingefroren.
+        """
+        return frozenset(h.casefold() for h in haystack)
+
+    @staticmethod
+    def contains(
+        haystack: Collection[str],
+        needle: str,
+        /,
+        *,
+        case_insensitive: bool = True,
+        folded: frozenset[str] | None = None,
+    ) -> bool:
         """
         Case-insensitiver Whitelist-Check. Logik unverändert.
+
+        `folded` nimmt eine vorab berechnete Casefold-Menge von `haystack` auf
+        und erspart die Neuberechnung je Aufruf. Ohne `folded` wird nur ein
+        `frozenset`-Haystack über den Cache gefaltet; sonst wird inline verglichen
+        (Abbruch beim ersten Treffer, keine Zwischenmenge).
         """
         if case_insensitive and isinstance(needle, str):
-            return needle.casefold() in {h.casefold() for h in haystack}
+            gesucht: str = needle.casefold()
+            if folded is not None:
+                return gesucht in folded
+            if isinstance(haystack, frozenset):
+                return gesucht in InputUtils._folded(haystack)
+            return any(h.casefold() == gesucht for h in haystack)
         return needle in haystack
 
     @staticmethod
@@ -168,8 +197,41 @@ class InputUtils:
         if allowed is not None and len(allowed) == 0:
             raise ValueError("allowed darf nicht leer sein")
 
-        conv: Callable[[str], T] = cast(Callable[[str], T], DATA_TYPES.get(typ, typ))
-        allowed_set: set[T] | None = set(allowed) if allowed is not None else None
+        # Schnellpfade für die Standardtypen; DATA_TYPES bleibt Erweiterungspunkt
+        conv: Callable[[str], T]
+        if typ is str:
+            conv = cast(Callable[[str], T], str)
+        elif typ is int:
+            conv = cast(Callable[[str], T], int)
+        elif typ is float:
+            conv = cast(Callable[[str], T], float)
+        elif typ is bool:
+            conv = cast(Callable[[str], T], _BOOL_CONVERTER)
+        else:
+            conv = cast(Callable[[str], T], DATA_TYPES.get(typ, typ))
+        # set/frozenset direkt übernehmen (keine Kopie); sonst einmalig in ein set überführen
+        allowed_set: set[T] | frozenset[T] | None = (
+            allowed if isinstance(allowed, (set, frozenset))
+            else (set(allowed) if allowed is not None else None)
+        )
+
+        # Schleifeninvarianten: Elementtypen der Whitelist und deren Casefold-Menge
+        allowed_all_str: bool = allowed_set is None or all(isinstance(a, str) for a in allowed_set)
+        # Einmal je Aufruf falten (ohne globalen Cache: Whitelists des Aufrufers nicht festhalten)
+        allowed_folded: frozenset[str] | None = (
+            frozenset(h.casefold() for h in cast(Collection[str], allowed_set))
+            if allowed_set is not None and allowed_all_str
+            else None
+        )
+        # Fehleranzeige der (unveränderlichen) Whitelist einmalig formatieren:
+        # Reihenfolge des Aufrufers (ohne Duplikate); nur ungeordnete Mengen werden sortiert.
+        allowed_display: str | None = None
+        if allowed is not None:
+            ordnung: Collection[T] = (
+                sorted(allowed, key=str) if isinstance(allowed, (set, frozenset))
+                else dict.fromkeys(allowed)
+            )
+            allowed_display = ", ".join(map(str, ordnung))
 
         while True:
             raw = input(prompt)
@@ -180,22 +242,26 @@ class InputUtils:
                 print(f"Ungültige Eingabe. Erwarteter Typ: {type_name}")
                 continue
 
-            approved: set[T] = allowed_set if allowed_set is not None else {value}
+            # Ohne Whitelist ist jeder konvertierbare Wert zulässig (kein Mengen-/Cache-Umweg)
+            if allowed_set is None:
+                return value
 
-            is_all_str = isinstance(value, str) and all(isinstance(a, str) for a in approved)
-            if (InputUtils.contains(approved, value, case_insensitive=case_insensitive)
-                if is_all_str else (value in approved)):
+            is_all_str = allowed_all_str and isinstance(value, str)
+            if (InputUtils.contains(allowed_set, value, case_insensitive=case_insensitive, folded=allowed_folded)
+                if is_all_str else (value in allowed_set)):
                 return value
 
-            display = ", ".join(map(str, sorted(approved, key=lambda x: str(x))))
-            print(f"Ungültige Eingabe. Erlaubt: {display}")
+            print(f"Ungültige Eingabe. Erlaubt: {allowed_display}")
+
+# Bool-Konverter einmalig als schlichte Funktion gebunden (ohne Alias-Umweg).
+_BOOL_CONVERTER: Final[Callable[[str], bool]] = InputUtils._bool_converter
 
 # Öffentliche Konverter-Tabelle. Logik unverändert.
 DATA_TYPES: Final[dict[type[Any], Callable[[str], Any]]] = {
     str: str,
     int: int,
     float: float,
-    bool: InputUtils.bool_converter,
+    bool: _BOOL_CONVERTER,
 }
 
 # Abwärtskompatible Wrapper.
@@ -1,9 +1,15 @@
 from __future__ import annotations
-from typing import overload, final
+import math
+from functools import lru_cache
+from typing import Final, overload, final
 import numpy as np
 
 __all__ = ["TypeUtils"]
 
+# Vorberechnete Werte 10**(-n): float32 für n ∈ [0, 31], float64 für n ∈ [0, 63]
+_POW10_NEG_F32: Final[tuple[np.float32, ...]] = tuple(np.float32(10.0 ** (-n)) for n in range(32))
+_POW10_NEG_F64: Final[tuple[np.float64, ...]] = tuple(np.float64(10.0 ** (-n)) for n in range(64))
+
 @final
 class TypeUtils:
     """
@@ -72,6 +78,28 @@ class TypeUtils:
             Falls `value` weder int noch float ist.
         ValueError
             Falls `n < 0` (bei int) oder `value` NaN/±Inf ist.
+
+        Hinweise
+        --------
+        Ganzzahlige Exponenten werden direkt aus einer Tabelle gelesen (float32:
+        n ≤ 31, float64: n ≤ 63); alle übrigen Aufrufe sind über `(value, dtype)`
+        memoisiert.
+        """
+        if type(value) is int and value >= 0:
+            if dtype is np.float32 or (dtype is None and value <= 6):
+                if value < len(_POW10_NEG_F32):
+                    return _POW10_NEG_F32[value]
+            elif dtype is None or dtype is np.float64:
+                if value < len(_POW10_NEG_F64):
+                    return _POW10_NEG_F64[value]
+
+        return TypeUtils._eps(value, dtype)
+
+    @staticmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _eps(value: int | float, dtype: type[np.floating] | None) -> np.floating:
+        """
+        Memoisierter Kern von `eps`. `typed=True` trennt z. B. 1 (n = 1) von 1.0 (n = 0).
         """
         # Bestimme n
         if isinstance(value, int):
@@ -81,9 +109,20 @@ class TypeUtils:
         elif isinstance(value, float):
             if not np.isfinite(value):
                 raise ValueError("value muss endlich sein")
-            # Nachkommastellen anhand einer stabilen Dezimaldarstellung bestimmen
-            s = f"{value:.16f}".rstrip("0").rstrip(".")
-            n = len(s.split(".")[1]) if "." in s else 0
+            # Schnellpfad für exakte Zehnerpotenzen 10**(-n), n ∈ [0, 16], über log10.
+            # Exakter Vergleich: 10.0 ** -k == float(f"1e-{k}") für alle k ∈ [0, 16];
+            # Nachbarwerte (z. B. 0.0010000000000001) bleiben der Stringzählung überlassen.
+            n = -1
+            if value == 0.0:
+                n = 0
+            else:
+                k = -int(round(math.log10(abs(value))))
+                if 0 <= k <= 16 and 10.0 ** (-k) == abs(value):
+                    n = k
+            if n < 0:
+                # Nachkommastellen anhand einer stabilen Dezimaldarstellung bestimmen
+                s = f"{value:.16f}".rstrip("0").rstrip(".")
+                n = len(s.split(".")[1]) if "." in s else 0
         else:
             raise TypeError("value muss int oder float sein")
 
@@ -93,4 +132,63 @@ class TypeUtils:
         else:
             target_dtype = np.float32 if n <= 6 else np.float64
 
-        return target_dtype(10.0 ** (-n))
\ No newline at end of file
+        if target_dtype is np.float32 and n < len(_POW10_NEG_F32):
+            return _POW10_NEG_F32[n]
+        if target_dtype is np.float64 and n < len(_POW10_NEG_F64):
+            return _POW10_NEG_F64[n]
+        return target_dtype(10.0 ** (-n))
+
+    @staticmethod
+    def eps_array(values: np.ndarray, *, dtype: type[np.floating] | None = None) -> np.ndarray:
+        """
+        Vektorisierte Variante von `eps` für NumPy‑Arrays.
+
+        Parameter
+        ---------
+        values : np.ndarray
+            Ganzzahliger Dtype: Basis‑10‑Exponenten `n` (n ≥ 0), wie `eps(int)`.
+            Gleitkomma‑Dtype: Toleranzwerte; je Element wird n = −round(log10|v|)
+            bestimmt (0 für v = 0, nach unten auf 0 begrenzt).
+        dtype : type[np.floating] | None, optional
+            Erzwingt den Ziel‑Dtype. Bei None: float32, falls max(n) ≤ 6, sonst float64.
+
+        Rückgabe
+        --------
+        np.ndarray
+            Elementweise 10**(-n) in der Form von `values`.
+
+        Ausnahmen
+        ---------
+        ValueError
+            Falls ein ganzzahliger Exponent negativ ist oder `values` NaN/±Inf enthält.
+
+        Hinweise
+        --------
+        Der Dtype entscheidet wie bei `eps` der Typ: Ganzzahlen sind Exponenten
+        (`eps_array(np.array([3, 6]))` → [1e-3, 1e-6]). Gleitkommawerte sind nur für
+        Zehnerpotenzen identisch zu `eps(float)`; sonstige Werte werden auf die
+        nächstliegende Zehnerpotenz gerundet (keine Nachkommastellen‑Zählung).
+        """
+        arr = np.asarray(values)
+        n: np.ndarray
+        if np.issubdtype(arr.dtype, np.integer):
+            if np.any(arr < 0):
+                raise ValueError("exp10 darf nicht negativ sein")
+            n = arr.astype(np.int32)
+        else:
+            vals = arr.astype(np.float64)
+            if not np.all(np.isfinite(vals)):
+                raise ValueError("values muss endlich sein")
+
+            betrag = np.abs(vals)
+            with np.errstate(divide="ignore"):
+                exponent = -np.round(np.log10(np.where(betrag == 0.0, 1.0, betrag)))
+            n = np.maximum(exponent, 0.0).astype(np.int32)
+
+        out_dtype: type[np.floating]
+        if dtype is not None:
+            out_dtype = dtype
+        else:
+            out_dtype = np.float32 if n.size == 0 or n.max() <= 6 else np.float64
+
+        return np.power(out_dtype(10.0), -n.astype(out_dtype))
@@ -1,6 +1,10 @@
 from __future__ import annotations
+from math import inf
 from typing import Optional
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 class GeometryUtil:
     """
     Physikalische Hilfsfunktionen für Bremsweg und Bremsbeginn.
@@ -16,14 +20,16 @@ class GeometryUtil:
 
     KMH2MPS: float = 1000.0 / 3600.0
 
+    # Umrechnungsfaktoren nach m/s (Lookup statt Vergleichskette)
+    _UNIT_FACTORS: dict[str, float] = {"mps": 1.0, "kmh": KMH2MPS, "km/h": KMH2MPS}
+
     @staticmethod
     def _to_mps(v: float, v_unit: str) -> float:
         """Konvertiert Geschwindigkeit in m/s. `v_unit` ∈ {"mps", "kmh", "km/h"}."""
-        if v_unit == "mps":
-            return v
-        if v_unit in ("kmh", "km/h"):
-            return v * GeometryUtil.KMH2MPS
-        raise ValueError("v_unit muss 'mps' oder 'kmh' sein")
+        f = GeometryUtil._UNIT_FACTORS.get(v_unit)
+        if f is None:
+            raise ValueError("v_unit muss 'mps' oder 'kmh' sein")
+        return v * f
 
     @staticmethod
     def bremsbeginn(
@@ -65,25 +71,37 @@ class GeometryUtil:
         if s_total <= stop_window:
             return float(stop_window)
 
-        candidates: list[float] = []
+        # Laufendes Maximum der Kandidaten (ohne Zwischenliste)
+        best: float = -inf
+        have: bool = False
 
         # Kinematischer Kandidat, wenn vollständig spezifiziert
         if v0 is not None and v1 is not None and a is not None and a != 0.0:
             v0_mps = GeometryUtil._to_mps(v0, v_unit)
             v1_mps = GeometryUtil._to_mps(v1, v_unit)
             decel = max(0.0, (v0_mps * v0_mps - v1_mps * v1_mps) / (2.0 * abs(a)))  # s = (v0² − v1²) / (2|a|)
-            candidates.append(s_total - decel)
+            # Sofort bremsen: ohne Heuristik-Kandidaten (die größer ausfallen könnten)
+            # landet das Ergebnis ohnehin auf stop_window
+            if rel is None and fallback is None and decel >= s_total - stop_window:
+                return float(stop_window)
+            best = s_total - decel
+            have = True
 
         # Relativer Kandidat (rel in [0, 1])
         if rel is not None:
-            rel_c = min(1.0, max(0.0, rel))
-            candidates.append(rel_c * s_total)
+            c = min(1.0, max(0.0, rel)) * s_total
+            if not have or c > best:
+                best = c
+            have = True
 
         # Absoluter Fallback-Kandidat
         if fallback is not None:
-            candidates.append(s_total - fallback)
+            c = s_total - fallback
+            if not have or c > best:
+                best = c
+            have = True
 
-        start = max(candidates) if candidates else stop_window
+        start = best if have else stop_window
         start = min(s_total, max(stop_window, start))  # Clamp auf gültigen Bereich
         return float(start)
 
@@ -102,7 +120,6 @@ class GeometryUtil:
         Interpretation: a_neg ≤ 0 (negatives Vorzeichen für Bremsen). Intern wird `abs(a_neg)` verwendet.
         Hinweis: Falls a_neg == 0 → Rückgabe `inf` (kein Bremsen möglich gemäß Modell).
         """
-        from math import inf
         a = abs(a_neg)
         if a == 0.0:
             return inf
@@ -129,6 +146,64 @@ class GeometryUtil:
         """
         return rest <= GeometryUtil.bremsweg(v0, v1, a_neg, v_unit=v_unit) + max(0.0, stop_window)
 
+    @staticmethod
+    def bremsweg_batch(
+            v0: ArrayLike,
+            v1: ArrayLike,
+            a_neg: ArrayLike,
+            *,
+            v_unit: str = "mps"
+    ) -> np.ndarray:
+        """
+        Vektorisierte Variante von `bremsweg` für viele Fahrzeuge (elementweise, broadcast-fähig).
+
+        Formel und Sonderfall wie `bremsweg`: a_neg == 0 → `inf`.
+        """
+        f = GeometryUtil._UNIT_FACTORS.get(v_unit)
+        if f is None:
+            raise ValueError("v_unit muss 'mps' oder 'kmh' sein")
+        v0_mps = np.asarray(v0, dtype=np.float64) * f
+        v1_mps = np.asarray(v1, dtype=np.float64) * f
+        a = np.abs(np.asarray(a_neg, dtype=np.float64))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = np.maximum(0.0, (v0_mps * v0_mps - v1_mps * v1_mps) / (2.0 * a))
+        return np.where(a == 0.0, np.inf, s)
+
+    @staticmethod
+    def muss_bremsen_rest_batch(
+            rest: ArrayLike,
+            v0: ArrayLike,
+            v1: ArrayLike,
+            a_neg: ArrayLike,
+            stop_window: ArrayLike = 0.0,
+            *,
+            v_unit: str = "mps"
+    ) -> np.ndarray:
+        """
+        Vektorisierte Variante von `muss_bremsen_rest`; liefert eine boolesche Maske.
+        """
+        weg = GeometryUtil.bremsweg_batch(v0, v1, a_neg, v_unit=v_unit)
+        return np.asarray(rest, dtype=np.float64) <= weg + np.maximum(0.0, stop_window)
+
+    @staticmethod
+    def bremsbeginn_kinematik_batch(
+        s_total: ArrayLike,
+        stop_window: ArrayLike,
+        *,
+        v0: ArrayLike,
+        v1: ArrayLike,
+        a_neg: ArrayLike,
+        v_unit: str = "mps"
+    ) -> np.ndarray:
+        """
+        Vektorisierte Variante von `bremsbeginn_kinematik` (elementweise, broadcast-fähig).
+
+        Klemmung wie im Skalarfall: min(s_total, max(stop_window, s_total − bremsweg)).
+        """
+        s_total_a = np.asarray(s_total, dtype=np.float64)
+        s = GeometryUtil.bremsweg_batch(v0, v1, a_neg, v_unit=v_unit)
+        return np.minimum(s_total_a, np.maximum(stop_window, s_total_a - s))
+
     @staticmethod
     def bremsbeginn_kinematik(
         s_total: float,
@@ -147,32 +222,23 @@ class GeometryUtil:
 
         Interpretation: a_neg ≤ 0 (Bremsen). Intern wird `abs(a_neg)` verwendet.
         `v_unit` steuert die Einheit der Geschwindigkeiten.
+        Bremsweg und Einheitenumrechnung sind inline berechnet (keine Aufrufkette).
         """
-        s = GeometryUtil.bremsweg(v0, v1, a_neg, v_unit=v_unit)
+        f = GeometryUtil._UNIT_FACTORS.get(v_unit)
+        if f is None:
+            raise ValueError("v_unit muss 'mps' oder 'kmh' sein")
+        a = abs(a_neg)
+        if a == 0.0:  # kein Bremsen möglich → bremsweg = inf → start = stop_window
+            return min(s_total, stop_window)
+        v0_mps = v0 * f
+        v1_mps = v1 * f
+        s = max(0.0, (v0_mps * v0_mps - v1_mps * v1_mps) / (2.0 * a))
         start = s_total - s
         return min(s_total, max(stop_window, start))
 
-    @staticmethod
-    def verlangsamen_vertikal(
-            s_total: float,
-            stop_window: float,
-            *,
-            v0: float,
-            v1: float,
-            a_neg: float,
-            v_unit: str = "mps",
-    ) -> float:
-        """
-        Startpunkt der Langsamphase in z-Richtung. Klemmt auf [stop_window, s_total].
-        """
-        return GeometryUtil.bremsbeginn_kinematik(
-            s_total=s_total,
-            stop_window=stop_window,
-            v0=v0,
-            v1=v1,
-            a_neg=a_neg,
-            v_unit=v_unit,
-        )
+    # Startpunkt der Langsamphase in z-Richtung. Klemmt auf [stop_window, s_total].
+    # Direkter Alias (gleiche Signatur) statt Weiterleitungsfunktion.
+    verlangsamen_vertikal = bremsbeginn_kinematik
 
     @staticmethod
     def stoppen_vertikal(stop_window: float) -> float:
@@ -1,6 +1,8 @@
 # math_utils.py
 from __future__ import annotations
 
+import math
+from functools import lru_cache
 from typing import Final, final
 
 __all__: Final[tuple[str, ...]] = ("MathFunctions", "math_functions")
@@ -13,10 +15,15 @@ class MathFunctions:
     Hilfsfunktionen.
     """
 
+    # Bis zu dieser Faktorenzahl ist das direkte Produkt günstiger als b! / (a−1)!
+    _DIREKT_MAX: Final[int] = 32
+    # Nur Fakultäten bis hierher werden memoisiert (1000! ≈ 1 KB; Cache damit ≤ ~130 KB)
+    _CACHE_MAX: Final[int] = 1000
+
     @staticmethod
     def fac(m: int = 1, n: int = 1) -> int:
         """
-        Produkt ∏_{k=n}^{m} k ohne `math.factorial`.
+        Produkt ∏_{k=n}^{m} k.
 
         Konventionen:
             - m < n → 1 (leeres Produkt)
@@ -25,7 +32,7 @@ class MathFunctions:
         Schaltlogik:
             - Enthält das Intervall 0 → sofort 0.
             - Reines Negativintervall → in positives Intervall abbilden, Vorzeichen per Parität.
-            - Sonst balanciertes Divide-&-Conquer ohne feste Grenzwerte.
+            - Sonst math.factorial-Quotient bzw. math.prod (C-Implementierung).
 
         Beispiele:
             >>> MathFunctions.fac(5, 3)   # 3 · 4 · 5
@@ -48,7 +55,7 @@ class MathFunctions:
             a: int = -m            # kleinster positiver Betrag
             b: int = -n            # größter positiver Betrag
             width: int = m - n + 1 # Anzahl Faktoren im Intervall
-            sign: int = -1 if (width & 1) else 1  # Vorzeichen aus Parität
+            sign: int = 1 - ((width & 1) << 1)  # Vorzeichen aus Parität (verzweigungsfrei)
             result = sign * MathFunctions._prod_interval(a, b)
 
         else:  # Reines Positivintervall
@@ -59,33 +66,36 @@ class MathFunctions:
     @staticmethod
     def _prod_interval(a: int, b: int) -> int:
         """
-        Produkt der Folge a..b über balanciertes Divide-&-Conquer.
+        Produkt der Folge a..b (1 ≤ a ≤ b) über C-Routinen der Standardbibliothek.
+
+        Deckt das Intervall den Großteil von 1..b ab, wird der Quotient
+        b! / (a−1)! gebildet (math.factorial teilt intern binär auf); kurze
+        Intervalle weit oberhalb von 1 laufen über math.prod, damit kein
+        unnötig großes (a−1)! entsteht. Fakultäten bis `_CACHE_MAX` werden
+        memoisiert (`_fakultaet`), größere jedes Mal neu berechnet.
+        Bis `_DIREKT_MAX` Faktoren wird immer direkt multipliziert.
+        """
+        if b - a < MathFunctions._DIREKT_MAX or a - 1 > b - a:
+            return math.prod(range(a, b + 1))
+        return MathFunctions._fakultaet(b) // MathFunctions._fakultaet(a - 1)
 
-        Keine festen Schwellwerte: immer rekursiv balancieren. Liefert stabile
-        Zwischenwertgrößen und gute Performance auch für große Intervalle.
+    @staticmethod
+    def _fakultaet(k: int) -> int:
         """
-        result: int
-        if a > b:
-            result = 1
-        else:
-            result = MathFunctions._prod_dc(a, b)
-        return result
+        k! über math.factorial; bis `_CACHE_MAX` aus dem Cache, darüber ungecacht
+        (beliebig große Ganzzahlen sollen nicht prozessweit liegen bleiben).
+        """
+        if k <= MathFunctions._CACHE_MAX:
+            return MathFunctions._fakultaet_klein(k)
+        return math.factorial(k)
 
     @staticmethod
-    def _prod_dc(a: int, b: int) -> int:
+    @lru_cache(maxsize=128)
+    def _fakultaet_klein(k: int) -> int:
         """
-        Divide-and-Conquer-Produkt auf [a,b] (inkl.).
+        k! für k ≤ `_CACHE_MAX` (memoisiert; wiederholte bzw. überlappende Intervalle).
         """
-        result: int
-        if a == b:
-            result = a
-
-        else:
-            mid: int = (a + b) // 2
-            left: int = MathFunctions._prod_dc(a, mid)
-            right: int = MathFunctions._prod_dc(mid + 1, b)
-            result = left * right
-        return result
+        return math.factorial(k)
 
 
 math_functions: type[MathFunctions] = MathFunctions
\ No newline at end of file
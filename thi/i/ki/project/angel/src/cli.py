@@ -1,4 +1,5 @@
 def main() -> None:
-    # Startet das Skript, das auf Top-Level arbeitet
-    import core.angel  # noqa: F401
+    # Startet die Konsolenanwendung über die Einstiegsfunktion
+    from core.angel import main as angel_main
+    angel_main()
     exit(0)
\ No newline at end of file
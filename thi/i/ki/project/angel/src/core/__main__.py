@@ -1,2 +1,4 @@
 # erlaubt: python -m core
-import core.angel  # noqa: F401  # führt das Skript aus
\ No newline at end of file
+from core.angel import main
+
+main()
\ No newline at end of file
@@ -1,18 +1,142 @@
 import math
 import sys
+from functools import lru_cache
+from typing import Callable
 import numpy as np
+from numpy.typing import ArrayLike
 
 from util.evaluation import read_input, eps as _eps
 
 PI = math.pi
 PI_HALBE = PI / 2
+PI_VIERTEL = PI / 4
+TAN_PI_8 = math.sqrt(2.0) - 1.0  # tan(π/8), Schwelle der π/4-Reduktion
+RAD_TO_DEG = 180.0 / PI  # Bogenmaß → Gradmaß (Faktor wie math.degrees)
 
+# Rekurrenzfaktoren (2k+1)/(2k+3) der arctan-Reihe; 64 Glieder decken |t| ≤ tan(π/8)
+# bis ε = 1e-16 ab, längere Reihen (nur bei extrem kleinem ε) rechnen fortlaufend
+_REC_FACTORS: tuple[float, ...] = tuple((2.0 * k + 1.0) / (2.0 * k + 3.0) for k in range(64))
+_REC_ANZAHL: int = len(_REC_FACTORS)
+
+# Optional: JIT-Übersetzung der Reihe (Extra „jit“); ohne numba reines Python
+try:
+    from numba import njit as _njit
+except ModuleNotFoundError:
+    def _njit(*_args, **_kwargs):
+        return lambda funktion: funktion
+
+
+@lru_cache(maxsize=32)
+def _eps_float(genauigkeit: int) -> float:
+    """ε = 10^(−genauigkeit) als Python-float (je Genauigkeit einmalig berechnet)."""
+    return float(_eps(genauigkeit, dtype=np.float64))
+
+
+@_njit(cache=True)
+def _arctan_taylor(tangens_wert: float, eps: float) -> float:
+    """
+    Reihenentwicklung arctan(t) = Σ (-1)^k * t^(2k+1) / (2k+1) für |t| ≤ 1.
+
+    Args:
+        tangens_wert: Argument t (bereits reduziert).
+        eps: Abbruchschranke für |a_k|.
+
+    Returns:
+        Partialsumme der Reihe bis |a_k| ≤ eps.
+    """
+    reihen_summe: float = 0.0
+    aktueller_summand: float = tangens_wert
+    # Vorzeichenwechsel in −t² gebündelt (Negation exakt → bitgleiche Glieder)
+    minus_tangens_quadrat: float = -(tangens_wert * tangens_wert)
+
+    # Rekurrenz a_{k+1} = −a_k · t² · (2k+1)/(2k+3)
+    # Stufe 1: Faktoren aus der Tabelle (Regelfall, ohne Division)
+    for korrektur_faktor in _REC_FACTORS:
+        if abs(aktueller_summand) <= eps:
+            return reihen_summe
+        reihen_summe += aktueller_summand
+        aktueller_summand = aktueller_summand * minus_tangens_quadrat * korrektur_faktor
+
+    # Stufe 2: jenseits der Tabelle mit laufendem Nenner 2k+1 (kein 2·k je Glied)
+    nenner: float = 2.0 * _REC_ANZAHL + 1.0
+    while abs(aktueller_summand) > eps:
+
+        reihen_summe += aktueller_summand
+        aktueller_summand = aktueller_summand * minus_tangens_quadrat * (nenner / (nenner + 2.0))
+        nenner += 2.0
+
+    return reihen_summe
+
+
+@_njit(cache=True)
+def _arctan_gh(tangens_wert: float, eps: float) -> float:
+    """
+    Schnell konvergente Darstellung arctan(t) = 2 Σ_{m≥1} 1/(2m−1) · g_m / (g_m² + h_m²).
+
+    Rekurrenz (Abrarov/Quine): g_1 = 2/t, h_1 = 1,
+        g_{m+1} = g_m · (1 − 4/t²) + 4·h_m/t,
+        h_{m+1} = h_m · (1 − 4/t²) − 4·g_m/t.
+    Für |t| ≤ tan(π/8) werden deutlich weniger Glieder benötigt als bei der
+    Taylor-Reihe (ε = 1e-14: höchstens 9 statt 17).
+
+    Args:
+        tangens_wert: Argument t (bereits reduziert).
+        eps: Abbruchschranke für die Hüllkurve des Glieds.
+
+    Returns:
+        Partialsumme bis zur Hüllkurve ≤ eps.
+
+    Kleine Argumente:
+        Für |t| < 1e-8 gilt arctan(t) = t in Doppelgenauigkeit (t³/3 < ½ ulp);
+        t wird direkt geliefert. Das deckt auch t = 0 und t² = 0 (Unterlauf,
+        |t| ≲ 1.5e-162) ab, wo 4/t² sonst durch null teilen würde.
+
+    Selbstprüfung (doctest):
+        >>> _arctan_gh(0.0, 1e-14), _arctan_gh(1e-170, 1e-14), _arctan_gh(-1e-162, 1e-14)
+        (0.0, 1e-170, -1e-162)
+        >>> _arctan_gh(1e-9, 1e-14) == math.atan(1e-9)
+        True
+        >>> abs(_arctan_gh(0.4, 1e-14) - math.atan(0.4)) < 1e-14
+        True
+    """
+    if abs(tangens_wert) < 1e-8:
+        return tangens_wert
+
+    faktor_a: float = 1.0 - 4.0 / (tangens_wert * tangens_wert)
+    faktor_b: float = 4.0 / tangens_wert
+    g: float = 2.0 / tangens_wert
+    h: float = 1.0
+    nenner: float = 1.0
+    reihen_summe: float = 0.0
+    eps_quadrat: float = eps * eps
+    betrag_quadrat: float = g * g + h * h
+
+    # Abbruch über die Hüllkurve |Glied| ≤ 2 / ((2m−1) · √(g² + h²)): die Glieder selbst
+    # oszillieren und können vor Konvergenz einzeln nahe 0 liegen
+    while (2.0 / nenner) * (2.0 / nenner) > eps_quadrat * betrag_quadrat:
+
+        reihen_summe += 2.0 / nenner * g / betrag_quadrat
+        g, h = g * faktor_a + faktor_b * h, h * faktor_a - faktor_b * g
+        nenner += 2.0
+        betrag_quadrat = g * g + h * h
+
+    return reihen_summe
+
+
+# Wählbare Reihendarstellungen für arctan(t), |t| ≤ tan(π/8)
+_REIHEN: dict[str, Callable[[float, float], float]] = {"taylor": _arctan_taylor, "gh": _arctan_gh}
+
+
+@lru_cache(maxsize=4096)
 def angel(
         x1: float,
         y1: float,
         x2: float,
         y2: float,
-        genauigkeit: int = (sys.float_info.dig - 1)
+        genauigkeit: int = (sys.float_info.dig - 1),
+        *,
+        fast: bool = False,
+        reihe: str = "taylor",
 ) -> float:
     """
     Berechnet den Winkel φ in Grad zwischen der x-Achse durch P1 und der Strecke P1→P2.
@@ -23,22 +147,30 @@ def angel(
         x2: x-Koordinate von P2. Muss ≥ x1 sein.
         y2: y-Koordinate von P2. Muss ≥ y1 sein.
         genauigkeit: Dezimalstellen; ε = 10^(−genauigkeit). Standard: 14.
+        fast: True → math.atan2 statt Reihenentwicklung (konstante Laufzeit).
+        reihe: "taylor" (Standard) oder "gh" (g_m/h_m-Darstellung, weniger Glieder).
 
     Returns:
         Winkel φ in Grad im Bereich [0.0, 90.0].
 
     Raises:
-        ValueError: Falls x2 < x1 oder y2 < y1.
+        ValueError: Falls x2 < x1 oder y2 < y1 oder `reihe` unbekannt ist.
 
     Notes:
         - Reihenentwicklung von arctan(t) mit Argumentreduktion.
         - Für |t| > 1: arctan(t) = π/2 − arctan(1/t).
-        - Für t nahe 1: arctan(t) = π/4 + arctan((t−1)/(t+1)).
+        - Für t nahe 1 (auch nach Inversion): arctan(t) = π/4 + arctan((t−1)/(t+1)).
         - Sonderfälle: Δx = 0 ∧ Δy > 0 → 90.0; Δx = Δy = 0 → 0.0.
-        - Für Produktion wäre math.atan2(Δy, Δx) ausreichend; hier bewusst nicht genutzt.
+        - Für Produktion reicht math.atan2(Δy, Δx); nur mit fast=True genutzt,
+          der Standardpfad bleibt die Reihenentwicklung.
+        - Reine Funktion; Ergebnisse werden per lru_cache memoisiert
+          (wiederholte Abfragen gleicher Punkte ohne erneute Reihenauswertung).
     """
 
-    eps: float = float(_eps(genauigkeit, dtype=np.float64))
+    eps: float = _eps_float(genauigkeit)
+    reihen_funktion = _REIHEN.get(reihe)
+    if reihen_funktion is None:
+        raise ValueError(f"reihe muss eine von {sorted(_REIHEN)} sein")
 
     # Eingabevalidierung
     if x2 < x1 or y2 < y1:
@@ -52,8 +184,13 @@ def angel(
     # → Keine zuweisung eines Wertes, da immer gesetzt wird in jedem Ablauf
     winkel_grad: float
 
+    # Schnellpfad: Bibliotheksfunktion (C-Implementierung, volle Doppelgenauigkeit);
+    # atan2 deckt Δx = 0 ∧ Δy > 0 (→ 90.0) selbst ab, nur Δx = Δy = 0 ist Sonderfall
+    if fast:
+        winkel_grad = math.degrees(math.atan2(delta_y, delta_x)) if (delta_x or delta_y) else 0.0
+
     # Sonderfälle ohne notwendigkeit einer Division
-    if delta_x == 0.0:
+    elif delta_x == 0.0:
         winkel_grad = 0.0 if delta_y == 0.0 else 90.0
 
     # t = tan(φ)
@@ -61,7 +198,6 @@ def angel(
         # tan(phi) = Gegenkathete / Ankathete = delta_y / delta_x
         tangens_wert: float = delta_y / delta_x
         basis_offset : float = 0.0
-        schwellwert: float = math.sqrt(2.0) - 1.0
 
         # Argumentenreduktion (bessere Konvergenz)
         argument_invertiert: bool = False
@@ -71,31 +207,17 @@ def angel(
             argument_invertiert = True
 
         # π/4-Argumentreduktion zur Beschleunigung der Reihe nahe t ≈ 1.
-        # Schwelle: schwellwert = tan(π/8) = √2 − 1. Für schwellwert ≤ t ≤ 1 gilt
+        # Schwelle: TAN_PI_8 = tan(π/8) = √2 − 1. Für TAN_PI_8 ≤ t ≤ 1 gilt
         # arctan(t) = π/4 + arctan((t−1)/(t+1)), wobei |(t−1)/(t+1)| ≤ √2 − 1 ⇒ schnelle Konvergenz.
-        elif schwellwert <= tangens_wert <= 1.0:
+        # Greift auch nach der Inversion (1/t ∈ (0, 1)): danach gilt stets |t| ≤ √2 − 1.
+        if TAN_PI_8 <= tangens_wert <= 1.0:
             # π/4 als Basis-Offset für die spätere Rücktransformation
-            basis_offset = PI_HALBE / 2
-            # u = tan(φ−π/4); stabil (t+1 ≥ 1 + schwellwert) und Konvergenz fördernd
+            basis_offset = PI_VIERTEL
+            # u = tan(φ−π/4); stabil (t+1 ≥ 1 + TAN_PI_8) und Konvergenz fördernd
             tangens_wert = (tangens_wert - 1.0) / (tangens_wert + 1.0)
 
-        # Reihe: arctan(t) = Σ (-1)^k * t ^ (2k + 1) / (2k + 1)
-        reihen_summe: float = 0.0
-        aktueller_summand: float = tangens_wert
-        reihen_index: int = 0
-        tangens_quadrat: float = tangens_wert * tangens_wert
-
-        while abs(aktueller_summand) > eps:
-
-            reihen_summe += aktueller_summand
-
-            # Mathematische Herleitung der Rekurrenz:
-            koeffizient_aktuell: float = 2.0 * reihen_index + 1.0
-            koeffizient_naechster: float = 2.0 * reihen_index + 3.0
-            korrektur_faktor: float = koeffizient_aktuell / koeffizient_naechster
-            aktueller_summand: float = -aktueller_summand * tangens_quadrat * korrektur_faktor
-
-            reihen_index += 1
+        # Reihe: arctan(t) = Σ (-1)^k * t ^ (2k + 1) / (2k + 1) bzw. g_m/h_m-Darstellung
+        reihen_summe: float = reihen_funktion(tangens_wert, eps)
 
         winkel_bogenmass = (
             PI_HALBE - (basis_offset + reihen_summe)
@@ -104,15 +226,58 @@ def angel(
         )
 
         # Gradmaß
-        winkel_grad = winkel_bogenmass * 180.0 / PI
+        winkel_grad = winkel_bogenmass * RAD_TO_DEG
 
     # Nachtrag zur verwendung als Methode: Return statement
     return round(winkel_grad, genauigkeit)
 
 
+def angel_batch(
+        x1: ArrayLike,
+        y1: ArrayLike,
+        x2: ArrayLike,
+        y2: ArrayLike,
+        genauigkeit: int = (sys.float_info.dig - 1),
+) -> np.ndarray:
+    """
+    Vektorisierte Variante von `angel` für viele Punktpaare (elementweise, ohne Python-Schleife).
+
+    Args:
+        x1, y1: Koordinaten der Punkte P1 (Skalar oder Array, broadcast-fähig).
+        x2, y2: Koordinaten der Punkte P2. Elementweise x2 ≥ x1 und y2 ≥ y1.
+        genauigkeit: Dezimalstellen der Rundung. Standard: 14.
+
+    Returns:
+        Array der Winkel φ in Grad im Bereich [0.0, 90.0].
+
+    Raises:
+        ValueError: Falls für ein Element x2 < x1 oder y2 < y1.
+
+    Notes:
+        - Nutzt np.arctan2 (entspricht `angel(..., fast=True)`).
+        - Sonderfall Δx = Δy = 0 → 0.0 wie im Skalarfall.
+    """
+    x1a = np.asarray(x1, dtype=np.float64)
+    y1a = np.asarray(y1, dtype=np.float64)
+    x2a = np.asarray(x2, dtype=np.float64)
+    y2a = np.asarray(y2, dtype=np.float64)
+
+    # Eingabevalidierung
+    if np.any(x2a < x1a) or np.any(y2a < y1a):
+        raise ValueError("Es muss gelten x2 >= x1 und y2 >= y1")
+
+    delta_x = x2a - x1a
+    delta_y = y2a - y1a
+
+    winkel_grad = np.degrees(np.arctan2(delta_y, delta_x))
+    winkel_grad = np.where((delta_x == 0.0) & (delta_y == 0.0), 0.0, winkel_grad)
+
+    return np.round(winkel_grad, genauigkeit)
+
+
 # - - - MAIN METHODE ZUM EINSTIEG / ALS STARTPUNKT - - -
-if __name__ == "__main__":
-    # Startpunkt für CLI-Aufruf
+def main() -> None:
+    """Startpunkt für CLI-Aufruf (lokale Variablen statt Modul-Globals)."""
     print("Angel-Modul Ausführung")
 
     # Hauptlogik (bereits im Skript vorhanden gewesen)
@@ -127,3 +292,7 @@ if __name__ == "__main__":
 
     # Anpassung der Ausgabe an die vorgegebene Genauigkeitsgrenze
     print(f"Berechneter Winkel: {ergebnis:.{6}f}")
+
+
+if __name__ == "__main__":
+    main()
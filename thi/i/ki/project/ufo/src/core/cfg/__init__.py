@@ -1,3 +1,3 @@
 # core/cfg/__init__.py
-from .profil_config import UfoSimLike, AutopilotCfg, DEFAULT_CFG
-__all__ = ["UfoSimLike", "AutopilotCfg", "DEFAULT_CFG"]
\ No newline at end of file
+from .profil_config import UfoSimLike, UfoSimEventLike, AutopilotCfg, DEFAULT_CFG
+__all__ = ["UfoSimLike", "UfoSimEventLike", "AutopilotCfg", "DEFAULT_CFG"]
\ No newline at end of file
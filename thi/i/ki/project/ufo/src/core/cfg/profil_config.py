@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import Final, Protocol
 
@@ -9,6 +10,7 @@ Autopilot-Konfiguration und Simulator-Protokoll
 
 Zweck
 - Zentrale Definition des Minimal-Protokolls `UfoSimLike` für den Simulator.
+- Optionales Ereignis-Protokoll `UfoSimEventLike` (blockierende Schwellen-Hooks).
 - Unveränderliche Konfiguration `AutopilotCfg` mit wohldefinierten Einheiten.
 
 Normative Hinweise (DIN-orientiert)
@@ -55,6 +57,21 @@ class UfoSimLike(Protocol):
     def request_delta_d(self, delta: int) -> None: ...
     def request_delta_i(self, delta: int) -> None: ...
 
+class UfoSimEventLike(UfoSimLike, Protocol):
+    """
+    Optionale Erweiterung von `UfoSimLike` um simulatorseitige Ereignisse.
+
+    - wait_dist_ge(dist)   → blockiert, bis get_dist() ≥ dist [m]
+    - progress_event()     → Event, das der Simulator je Tick setzt
+
+    Nutzen dieses Aufbaus:
+    - Die Schwellenprüfung läuft im Simulationstakt statt per Polling.
+    - Aufrufer erkennen jede Fähigkeit einzeln über `getattr(sim, "<name>", None)`.
+    """
+
+    def wait_dist_ge(self, dist: float) -> None: ...
+    def progress_event(self) -> threading.Event: ...
+
 @dataclass(slots=True, frozen=True)
 class AutopilotCfg:
     """
@@ -66,7 +83,10 @@ class AutopilotCfg:
     - slow_z_fallback [m]   : Vertikale Fallback-Schwelle (ohne Zielhöhe).
     - stop_z [m]            : Vertikaler Stoppbereich.
     - landing_slow_z [m]    : Abbremsbeginn vor Aufsetzen.
-    - poll_s [s]            : Poll-Intervall für Wartebedingungen.
+    - poll_s [s]            : Poll-Intervall für Wartebedingungen (Start/Rücksetzwert).
+    - poll_max_s [s]        : Obergrenze des wachsenden Poll-Intervalls (Backoff).
+    - poll_wachstum [1]     : Wachstumsfaktor des Poll-Intervalls je Abfrage.
+    - poll_spin_us [µs]     : Aktiv-Warten je Abfrage vor dem Stop-Durchgang.
     - v_up [Δv km/h]        : 0 → 10.
     - v_up_to_slow [Δv km/h]: 10 → 1.
     - v_cruise [Δv km/h]    : 0 → 15.
@@ -96,6 +116,9 @@ class AutopilotCfg:
     stop_z: float = 0.05          # Stoppfenster vertikal [m]
     landing_slow_z: float = 3.0   # vor Aufsetzen abbremsen
     poll_s: float = 0.01
+    poll_max_s: float = 0.1       # Backoff-Obergrenze [s]
+    poll_wachstum: float = 1.5    # Backoff-Faktor je Abfrage
+    poll_spin_us: float = 200.0   # Aktiv-Warten vor dem Schlafen [µs]
     v_up: int = 10                # 0  → 10 km/h
     v_up_to_slow: int = -9        # 10 → 1 km/h
     v_cruise: int = 15            # 0  → 15 km/h
@@ -113,4 +136,4 @@ class AutopilotCfg:
 DEFAULT_CFG: Final[AutopilotCfg] = AutopilotCfg()
 
 
-__all__ = ["UfoSimLike", "AutopilotCfg", "DEFAULT_CFG"]
+__all__ = ["UfoSimLike", "UfoSimEventLike", "AutopilotCfg", "DEFAULT_CFG"]
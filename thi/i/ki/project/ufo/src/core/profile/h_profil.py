@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 
+import asyncio
+import threading
 import time
 from typing import Callable
 from ..cfg import AutopilotCfg, UfoSimLike
@@ -19,17 +21,46 @@ Voraussetzungen
 - remainder() ist monoton fallend und terminiert.
 
 Öffentliche API
-- HProfil.warte_bis(bedingung, abfrage_s)
+- HProfil.warte_bis(bedingung, abfrage_s, *, max_s, wachstum, rest, reset_delta, takt, ereignis)
+- HProfil.warte_bis_adaptiv(bedingung, abfrage_s, *, spin_us, rest, ziel, takt)
 - HProfil.richtung_als_int(grad)
-- HProfil._profil_schritt_bis(sim, rest, schwelle_langsam, schwelle_stop, dv_beschleunigen, dv_abbremsen, konfig)
+- HProfil._profil_schritt_bis(sim, rest, ziel, dv, konfig, *, spin, warte_rest, takt)
+- HProfil.warte_bis_async(bedingung, abfrage_s, *, max_s, wachstum, rest, reset_delta)
+- HProfil.schrittweise_bis_async(sim, rest, schwelle_langsam, schwelle_stop, dv_beschleunigen, dv_abbremsen, konfig)
 """
 
+class _Taktgeber:
+    """
+    Gemeinsamer Schlaftakt für mehrere Warteschleifen.
+
+    `schlafe(pause)` schläft bis „letzter Weckzeitpunkt + pause“ statt pauschal
+    `pause` Sekunden: die Rechenzeit der Bedingungsprüfung wird abgezogen, sodass
+    sich keine Taktdrift über die Phasen hinweg aufsummiert. Bei Überlauf
+    (Ziel bereits vergangen) wird ohne Schlafen neu synchronisiert.
+    """
+
+    __slots__ = ("_weck",)
+
+    def __init__(self) -> None:
+        self._weck: float = time.perf_counter()
+
+    def schlafe(self, pause: float) -> None:
+        jetzt: float = time.perf_counter()
+        ziel: float = self._weck + pause
+        if ziel > jetzt:
+            time.sleep(ziel - jetzt)
+            self._weck = ziel
+        else:
+            self._weck = jetzt
+
+
 class HProfil:
     """
     Profil-Klasse für deterministische Abläufe.
 
     Bereiche
-    - Warten auf Bedingungen mit fester Abfrageperiode.
+    - Warten auf Bedingungen mit wachsender Abfrageperiode (Backoff)
+      oder kurzem Aktiv-Warten vor dem Schlafen (Schwellendurchgang).
     - Normalisierung von Winkeln auf ganzzahlige Grad.
     - Profilierte Geschwindigkeit zur Annäherung an ein Ziel (zweistufiges Profil).
     """
@@ -38,19 +69,110 @@ class HProfil:
     def warte_bis(
             bedingung: Callable[[], bool],
             abfrage_s: float,
+            *,
+            max_s: float = 0.1,
+            wachstum: float = 1.5,
+            rest: Callable[[], float] | None = None,
+            reset_delta: float = 0.0,
+            takt: _Taktgeber | None = None,
+            ereignis: threading.Event | None = None,
+    ) -> None:
+        """
+        Blockiert, bis `bedingung()` True liefert. Kein Timeout.
+
+        Die Abfrageperiode startet bei `abfrage_s` und wächst je Abfrage um den
+        Faktor `wachstum` bis höchstens `max_s` (exponentielles Backoff).
+        Ist `rest` gesetzt, fällt die Periode auf `abfrage_s` zurück, sobald
+        `rest()` seit dem letzten Rücksetzen um mehr als `reset_delta` gesunken ist.
+
+        Args:
+            bedingung: Abbruchbedingung.
+            abfrage_s: Start- und Rücksetzperiode [s].
+            max_s: Obergrenze der Abfrageperiode [s].
+            wachstum: Wachstumsfaktor der Periode je Abfrage (≥ 1).
+            rest: Optionale Restgröße zur Fortschrittserkennung.
+            reset_delta: Mindestabnahme von `rest()` für ein Rücksetzen.
+            takt: Optionaler gemeinsamer Schlaftakt (driftfrei über mehrere Wartephasen).
+            ereignis: Optionales Simulator-Event (je Tick gesetzt); ersetzt das Schlafen
+                durch `ereignis.wait(pause)`, die Periode dient dann nur als Obergrenze.
+        """
+        schlafe: Callable[[float], None]
+        if ereignis is not None:
+            def schlafe(pause_s: float) -> None:
+                ereignis.wait(pause_s)
+                ereignis.clear()
+        else:
+            schlafe = time.sleep if takt is None else takt.schlafe
+        pause: float = abfrage_s
+        rest_ref: float = rest() if rest is not None else 0.0
+
+        while not bedingung():
+            schlafe(pause)
+            pause = min(pause * wachstum, max_s)
+
+            if rest is not None:
+                rest_neu: float = rest()
+                if rest_ref - rest_neu > reset_delta:
+                    rest_ref = rest_neu
+                    pause = abfrage_s
+
+    @staticmethod
+    def warte_bis_adaptiv(
+            bedingung: Callable[[], bool],
+            abfrage_s: float,
+            *,
+            spin_us: float = 200.0,
+            rest: Callable[[], float] | None = None,
+            ziel: float = 0.0,
+            takt: _Taktgeber | None = None,
     ) -> None:
         """
         Blockiert, bis `bedingung()` True liefert. Kein Timeout.
+
+        Zweiphasig je Abfrage: zunächst Aktiv-Warten über `time.perf_counter()`
+        für bis zu `spin_us` Mikrosekunden, danach `time.sleep(abfrage_s)`.
+        Ist `rest` gesetzt, prüft das Aktiv-Warten direkt `rest() ≤ ziel` (ohne
+        Prädikat-Closure); zustandsbehaftete Prüfungen (z. B. Stagnation) in
+        `bedingung` laufen dann nur im Schlaftakt.
+
+        Args:
+            bedingung: Abbruchbedingung, geprüft im Schlaftakt.
+            abfrage_s: Schlafperiode nach dem Aktiv-Warten [s].
+            spin_us: Dauer des Aktiv-Wartens je Abfrage [µs].
+            rest: Optionale Restgröße für die Schwellenprüfung im Aktiv-Warten.
+            ziel: Schwelle für `rest`.
+            takt: Optionaler gemeinsamer Schlaftakt (driftfrei über mehrere Wartephasen).
         """
+        schlafe: Callable[[float], None] = time.sleep if takt is None else takt.schlafe
+        spin_s: float = spin_us * 1e-6
+        perf = time.perf_counter
+
         while not bedingung():
-            time.sleep(abfrage_s)
+            t_ende: float = perf() + spin_s
+            if rest is None:
+                while perf() < t_ende:
+                    if bedingung():
+                        return
+            else:
+                while perf() < t_ende:
+                    if rest() <= ziel:
+                        return
+            schlafe(abfrage_s)
 
     @staticmethod
     def richtung_als_int(grad: float) -> int:
         """
         Normalisiert einen Gradwinkel auf eine ganzzahlige Richtung 0 … 359.
+
+        Der Regelfall 0 … 719 (z.B. Ergebnis von `angle`) kommt ohne Division aus;
+        nur Werte außerhalb fallen auf den Modulo zurück. Rundung wie `round`.
         """
-        return int(round(grad)) % 360
+        d: int = int(round(grad))
+        if 0 <= d < 360:
+            return d
+        if 360 <= d < 720:
+            return d - 360
+        return d % 360
 
     @staticmethod
     def _profil_schritt_bis (
@@ -58,7 +180,11 @@ class HProfil:
         rest: Callable[[], float],
         ziel: float,
         dv: int,
-        abfrage_s: float,
+        konfig: AutopilotCfg,
+        *,
+        spin: bool = False,
+        warte_rest: Callable[[float], None] | None = None,
+        takt: _Taktgeber | None = None,
     ) -> None:
         """
         Ein Schritt des Annäherungsprofils: Geschwindigkeit anpassen und warten,
@@ -69,12 +195,51 @@ class HProfil:
             rest: Funktion, die den aktuellen Restwert liefert.
             ziel: Zielschwelle, die erreicht oder unterschritten werden soll.
             dv: Geschwindigkeitsinkrement in Schrittgröße (km/h pro Tick).
-            abfrage_s: Abfrageperiode für die Bedingungsprüfung.
+            konfig: Konfiguration mit Abfrageperiode und Backoff-Parametern.
+            spin: Aktiv-Warten vor dem Schlafen (präziser Schwellendurchgang).
+            warte_rest: Optionaler blockierender Simulator-Hook „warte bis rest() ≤ x“;
+                ersetzt das Polling vollständig.
+            takt: Optionaler gemeinsamer Schlaftakt beider Profilphasen.
+
+        Bietet der Simulator `progress_event()` (siehe `UfoSimEventLike`), wartet die
+        Phase ohne `spin` auf dieses Event statt im festen Takt zu schlafen.
+        Ohne `spin` wird die Abfrageperiode zurückgesetzt, sobald `rest()` um mehr
+        als 10 % von `ziel` gesunken ist; nahe der Schwelle wird dadurch eng abgefragt.
+        Mit `spin` prüft das Aktiv-Warten nur `rest() ≤ ziel`; die Stagnationsprüfung
+        läuft im Schlaftakt.
         """
+        if warte_rest is not None:
+            sim.request_delta_v(dv)
+            warte_rest(ziel)
+            return
+
+        progress_event: Callable[[], threading.Event] | None = getattr(sim, "progress_event", None)
+
         prog_check : ProgressCheck = ProgressCheck(rest=rest, ziel=ziel)
 
         sim.request_delta_v(dv)
-        HProfil.warte_bis(prog_check, abfrage_s)
+
+        if spin:
+            HProfil.warte_bis_adaptiv(
+                prog_check,
+                konfig.poll_s,
+                spin_us=konfig.poll_spin_us,
+                rest=rest,
+                ziel=ziel,
+                takt=takt,
+            )
+            return
+
+        HProfil.warte_bis(
+            prog_check,
+            konfig.poll_s,
+            max_s=konfig.poll_max_s,
+            wachstum=konfig.poll_wachstum,
+            rest=rest,
+            reset_delta=0.1 * ziel,
+            takt=takt,
+            ereignis=progress_event() if progress_event is not None else None,
+        )
 
     @staticmethod
     def schrittweise_bis(
@@ -85,6 +250,7 @@ class HProfil:
         dv_beschleunigen: int,
         dv_abbremsen: int,
         konfig: AutopilotCfg,
+        warte_rest: Callable[[float], None] | None = None,
     ) -> None:
         """
         Zweistufiges Geschwindigkeitsprofil zum Ziel:
@@ -95,11 +261,78 @@ class HProfil:
         Stufe 1 bringt das System schnell nahe ans Ziel, bis der verbleibende
         Weg klein genug für sicheres Bremsen ist. Stufe 2 bremst fein, verhindert
         Überlauf und hält im gewünschten Stop-Fenster.
+
+        Liefert der Aufrufer `warte_rest` (blockierender Simulator-Hook „warte bis
+        rest() ≤ x“), ersetzt dieser in beiden Phasen das Polling. Andernfalls teilen
+        sich beide Phasen einen driftfreien Schlaftakt.
         """
+        takt: _Taktgeber = _Taktgeber()
         # Phase 1: Beschleunigen
-        HProfil._profil_schritt_bis(sim, rest, schwelle_langsam, dv_beschleunigen, konfig.poll_s)
-        # Phase 2: Abbremsen
-        HProfil._profil_schritt_bis(sim, rest, schwelle_stop, dv_abbremsen, konfig.poll_s)
+        HProfil._profil_schritt_bis(
+            sim, rest, schwelle_langsam, dv_beschleunigen, konfig, warte_rest=warte_rest, takt=takt
+        )
+        # Phase 2: Abbremsen (Aktiv-Warten für präzisen Stop-Durchgang)
+        HProfil._profil_schritt_bis(
+            sim, rest, schwelle_stop, dv_abbremsen, konfig, spin=True, warte_rest=warte_rest, takt=takt
+        )
+        # Stop
+        sim.request_delta_v(konfig.v_stop)
+
+    @staticmethod
+    async def warte_bis_async(
+            bedingung: Callable[[], bool],
+            abfrage_s: float,
+            *,
+            max_s: float = 0.1,
+            wachstum: float = 1.5,
+            rest: Callable[[], float] | None = None,
+            reset_delta: float = 0.0,
+    ) -> None:
+        """
+        Asynchrone Variante von `warte_bis` (gleiches Backoff, `asyncio.sleep` statt
+        `time.sleep`). Blockiert nur die Koroutine, nicht den Thread; viele Autopiloten
+        können so in einer Ereignisschleife laufen. Kein Timeout.
+        """
+        pause: float = abfrage_s
+        rest_ref: float = rest() if rest is not None else 0.0
+
+        while not bedingung():
+            await asyncio.sleep(pause)
+            pause = min(pause * wachstum, max_s)
+
+            if rest is not None:
+                rest_neu: float = rest()
+                if rest_ref - rest_neu > reset_delta:
+                    rest_ref = rest_neu
+                    pause = abfrage_s
+
+    @staticmethod
+    async def schrittweise_bis_async(
+        sim: UfoSimLike,
+        rest: Callable[[], float],
+        schwelle_langsam: float,
+        schwelle_stop: float,
+        dv_beschleunigen: int,
+        dv_abbremsen: int,
+        konfig: AutopilotCfg,
+    ) -> None:
+        """
+        Asynchrone Variante von `schrittweise_bis` für viele gleichzeitige Autopiloten.
+
+        Beide Phasen warten über `warte_bis_async`; das Aktiv-Warten der Bremsphase
+        entfällt, da es die Ereignisschleife blockieren würde.
+        """
+        for ziel, dv in ((schwelle_langsam, dv_beschleunigen), (schwelle_stop, dv_abbremsen)):
+            prog_check: ProgressCheck = ProgressCheck(rest=rest, ziel=ziel)
+            sim.request_delta_v(dv)
+            await HProfil.warte_bis_async(
+                prog_check,
+                konfig.poll_s,
+                max_s=konfig.poll_max_s,
+                wachstum=konfig.poll_wachstum,
+                rest=rest,
+                reset_delta=0.1 * ziel,
+            )
         # Stop
         sim.request_delta_v(konfig.v_stop)
 
@@ -12,6 +12,7 @@ Hinweise
 - Deterministische, nebenwirkungsarme Routinen. Keine Nebenwirkungen außerhalb der Rückgaben.
 """
 from __future__ import annotations
+from functools import lru_cache
 from typing import NamedTuple
 
 from ..cfg import AutopilotCfg
@@ -36,6 +37,7 @@ class ZProfil:
         stop_schwelle: float
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _baue_plan(z: float, cfg: AutopilotCfg, start_z: float = 0.0) -> "ZProfil._ZProfilDaten | None":
         """
         Gemeinsame Vorberechnungen für vertikale Profile.
@@ -53,6 +55,10 @@ class ZProfil:
             ZProfil._ZProfilDaten | None: Plan mit kinematischen Größen oder `None`, wenn
             keine Strecke vorliegt (`z ≤ stop_schwelle`) oder Δv/Tick‑Magnituden 0 sind.
 
+        Hinweis:
+            Memoisiert (lru_cache); `AutopilotCfg` ist frozen und damit hashbar,
+            der Plan als NamedTuple unveränderlich und gefahrlos teilbar.
+
         Invarianten:
             - 0 ≤ brems_strecke ≤ gesamt_strecke
             - 0 ≤ langsam_fenster ≤ gesamt_strecke
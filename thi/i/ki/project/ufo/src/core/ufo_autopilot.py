@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from util.geometry import GeometryUtil
-from dataclasses import replace
-from math import hypot
-from typing import overload, final
+from util.mathematik import MathFunctions
+from math import atan2, degrees, hypot
+from typing import TYPE_CHECKING, Callable, overload, final
+
+if TYPE_CHECKING:  # nur für die Annotation von fly_to; vermeidet den tkinter-Import zur Laufzeit
+    from .ufosim3_2_9q import UfoSim
 
-from core.angel import angel as _angel
-from .ufosim3_2_9q import UfoSim
 from .cfg import AutopilotCfg, DEFAULT_CFG, UfoSimLike
 from .profile.h_profil import HProfil as Nav
 
@@ -42,7 +43,7 @@ def distance(x1: float, y1: float, x2: float, y2: float) -> float:
 
 def angle_q1(x1: float, y1: float, x2: float, y2: float) -> float:
     """
-    Basiswinkel φ ∈ [0°, 90°] für |Δx|, |Δy| via `core.angel.angel`.
+    Basiswinkel φ ∈ [0°, 90°] für |Δx|, |Δy| via `math.atan2`.
 
     Args:
         x1: x‑Koordinate von P1.
@@ -52,9 +53,7 @@ def angle_q1(x1: float, y1: float, x2: float, y2: float) -> float:
     Returns:
         φ in Grad im 1. Quadranten.
     """
-    dx = abs(x2 - x1)
-    dy = abs(y2 - y1)
-    return _angel(0.0, 0.0, dx, dy)
+    return degrees(atan2(abs(y2 - y1), abs(x2 - x1)))
 
 
 def angle(x1: float, y1: float, x2: float, y2: float) -> float:
@@ -62,8 +61,9 @@ def angle(x1: float, y1: float, x2: float, y2: float) -> float:
     Absolutwinkel φ ∈ [0°, 360°) von P1→P2 relativ +x.
 
     Verfahren:
-        φ_q1 = angle_q1(|Δx|, |Δy|); Quadrant aus Vorzeichen von Δx, Δy;
-        Basiswinkel setzen (180° bei Δx<0, 360° bei Δx≥0∧Δy<0); Korrektur ±φ_q1; mod 360.
+        atan2(Δy, Δx) liefert den vorzeichenbehafteten Winkel samt Quadrant in [−180°, 180°];
+        negative Werte werden um 360 verschoben (kein Float‑Modulo nötig).
+        Rundet ein winziger negativer Winkel auf 360.0, wird 0.0 geliefert.
 
     Args:
         x1: x‑Koordinate von P1.
@@ -73,16 +73,10 @@ def angle(x1: float, y1: float, x2: float, y2: float) -> float:
     Returns:
         φ in Grad im Bereich [0.0, 360.0).
     """
-    dx = x2 - x1
-    dy = y2 - y1
-
-    circle = 360.0
-    phi = _angel(0.0, 0.0, abs(dx), abs(dy))
-
-    # Quadrant bestimmen und globalen Winkel ableiten
-    sx, sy = (dx >= 0.0), (dy >= 0.0)
-    base = (circle / 2.0) * (not sx) + circle * (sx and not sy)
-    return (base + (phi if sx == sy else -phi)) % circle
+    phi = degrees(atan2(y2 - y1, x2 - x1))
+    if phi < 0.0:
+        phi += 360.0
+    return 0.0 if phi == 360.0 else phi
 
 
 def flight_distance(x1: float, y1: float, x2: float, y2: float, z: float) -> float:
@@ -115,12 +109,7 @@ def format_flight_data(sim: UfoSimLike, w: int = 10) -> str:
     Returns:
         Formatierte Zeile.
     """
-    t = sim.get_ftime()
-    x = sim.get_x()
-    y = sim.get_y()
-    z = sim.get_z()
-
-    return f"{t:>5.1f} s: {x:>{w}.1f} {y:>{w}.1f} {z:>{w}.1f}"
+    return f"{sim.get_ftime():>5.1f} s: {sim.get_x():>{w}.1f} {sim.get_y():>{w}.1f} {sim.get_z():>{w}.1f}"
 
 def fac(m: int = 1, n: int = 1) -> int:
     """
@@ -146,7 +135,9 @@ def _begrenze_neigung_deg(cfg: AutopilotCfg, deg: int) -> int:
         Geklemmter Winkel [°].
 
     """
-    return max(cfg.neigung_sinken_deg, min(cfg.neigung_steigen_deg, deg))
+    lo: int = cfg.neigung_sinken_deg
+    hi: int = cfg.neigung_steigen_deg
+    return lo if deg < lo else (hi if deg > hi else deg)
 
 def _set_neigung(
         sim: UfoSimLike,
@@ -161,6 +152,38 @@ def _set_neigung(
     sim.set_i(wert)
     return wert
 
+def _rest_bis(ziel: float, messung: Callable[[], float]) -> Callable[[], float]:
+    """
+    Restgröße max(ziel − messung(), 0) als Abfragefunktion.
+
+    Schlichte Closure mit bedingtem Ausdruck statt `max()`: wird im Abfragetakt
+    aufgerufen, der Builtin-Aufruf ist dort der größte Einzelposten.
+    """
+    def rest() -> float:
+        wert: float = ziel - messung()
+        return wert if wert > 0.0 else 0.0
+    return rest
+
+def _rest_ueber(ziel: float, messung: Callable[[], float]) -> Callable[[], float]:
+    """
+    Restgröße max(messung() − ziel, 0) als Abfragefunktion (Annäherung von oben).
+    """
+    def rest() -> float:
+        wert: float = messung() - ziel
+        return wert if wert > 0.0 else 0.0
+    return rest
+
+def _richtung_int(dx: float, dy: float) -> int:
+    """
+    Ganzzahliger Kurs 0 … 359 [°] für den Vektor (dx, dy); entspricht
+    `Nav.richtung_als_int(angle(...))` in einem Schritt.
+
+    atan2 liefert [−180°, 180°]; nach Rundung genügt eine Korrektur negativer
+    Werte, Modulo und der Zwischenwert in [0°, 360°) entfallen.
+    """
+    d: int = int(round(degrees(atan2(dy, dx))))
+    return d + 360 if d < 0 else d
+
 # ====================== AUTOPILOT ANGEHÖRIGE STANDARD FUNKTIONEN =====================
 @final
 class _Autopilot:
@@ -182,6 +205,10 @@ class _Autopilot:
         Kinematik, sonst heuristischer Fallback.
         Garantien: stop_at ≤ slow_at ≤ rest; stop_at ≥ 0.
         """
+        # Konfigurationswerte einmalig lokal binden (ein Attributzugriff je Feld)
+        stop_z: float = conf.stop_z
+        slow_fb: float = conf.slow_z_fallback
+
         def _fallback() -> tuple[float, float]:
             # Heuristik-Fallback ohne Kinematik:
             # Beginne die Langsamphase bei 80 % der Reststrecke.
@@ -189,10 +216,10 @@ class _Autopilot:
             # bei diskreten Geschwindigkeitsstufen; ersetzt wird dies durch eine kinematische
             # Berechnung, sobald v0/v1/a vorliegen.
 
-            slow: float = max(conf.stop_z, max(0.8 * rest, rest - conf.slow_z_fallback))
+            slow: float = max(stop_z, max(0.8 * rest, rest - slow_fb))
             slow = min(rest, slow)
 
-            stop: float = max(0.0, conf.stop_z)
+            stop: float = max(0.0, stop_z)
             return slow, stop
 
         slow_at: float
@@ -204,13 +231,13 @@ class _Autopilot:
             try:
                 slow_at: float = GeometryUtil.bremsbeginn(
                     s_total=rest,
-                    stop_window=conf.stop_z,
+                    stop_window=stop_z,
                     v0=conf.v_cruise_kmh,  # ggf. an Cfg-Namen anpassen
                     v1=conf.v_slow_kmh,     # Zielgeschwindigkeit der Langsamphase
                     a=conf.a_slow_mps2,     # konstante negative Beschleunigung
                     v_unit="kmh",
                 )
-                stop_at: float = GeometryUtil.stoppen_vertikal(conf.stop_z)
+                stop_at: float = GeometryUtil.stoppen_vertikal(stop_z)
 
                 kin = slow_at, stop_at
             except ValueError:
@@ -248,7 +275,7 @@ class _Autopilot:
             cfg: Konfiguration.
             use_heuristic: Heuristik-Berechnung als Möglichkeit für realitätsnahe Berechnungen
         """
-        conf: AutopilotCfg = replace(DEFAULT_CFG) if cfg is None else cfg
+        conf: AutopilotCfg = DEFAULT_CFG if cfg is None else cfg
 
         rest: float = max(z - sim.get_z(), 0.0)
         if rest <= conf.stop_z:
@@ -265,7 +292,7 @@ class _Autopilot:
 
             Nav.schrittweise_bis(
                 sim,
-                lambda: max(z - sim.get_z(), 0.0),
+                _rest_bis(z, sim.get_z),
                 slow_at,
                 stop_at,
                 conf.v_up,
@@ -287,6 +314,7 @@ class _Autopilot:
 
         Ablauf:
             Kurs aus Absolutwinkel setzen → Ziel‑Gesamtdistanz bestimmen → schrittweise bis Ziel.
+            Bietet der Simulator `wait_dist_ge` (UfoSimEventLike), entfällt das Polling.
 
         Args:
             sim: Simulator.
@@ -294,25 +322,30 @@ class _Autopilot:
             y: Ziel‑y [m].
             cfg: Konfiguration.
         """
-        conf = replace(DEFAULT_CFG) if cfg is None else cfg
+        conf = DEFAULT_CFG if cfg is None else cfg
 
         sx = sim.get_x()
         sy = sim.get_y()
 
-        a: float = angle(sx, sy, x, y)
-        grad: int = Nav.richtung_als_int(a)
-        sim.set_d(grad)
+        sim.set_d(_richtung_int(x - sx, y - sy))
 
-        distanz: float = sim.get_dist() + distance(sx, sy, x, y)
+        distanz: float = sim.get_dist() + hypot(x - sx, y - sy)
+
+        # Optionaler Simulator-Hook (UfoSimEventLike): rest ≤ g ⇔ get_dist() ≥ distanz − g
+        wait_dist_ge: Callable[[float], None] | None = getattr(sim, "wait_dist_ge", None)
+        warte_rest: Callable[[float], None] | None = (
+            None if wait_dist_ge is None else (lambda grenze: wait_dist_ge(distanz - grenze))
+        )
 
         Nav.schrittweise_bis(
             sim,
-            lambda: max(distanz - sim.get_dist(), 0.0),
+            _rest_bis(distanz, sim.get_dist),
             conf.slow_h,
             conf.stop_h,
             conf.v_cruise,
             conf.v_cruise_to_slow,
             conf,
+            warte_rest,
         )
 
     @staticmethod
@@ -327,13 +360,13 @@ class _Autopilot:
             sim: Simulator.
             cfg: Konfiguration.
         """
-        conf = replace(DEFAULT_CFG) if cfg is None else cfg
+        conf = DEFAULT_CFG if cfg is None else cfg
 
         _set_neigung(sim, conf, conf.neigung_sinken_deg)
 
         Nav.schrittweise_bis(
             sim,
-            lambda: max(sim.get_z() - 0.0, 0.0),
+            _rest_ueber(0.0, sim.get_z),
             conf.landing_slow_z,
             0.0,
             conf.v_up,
@@ -354,6 +387,8 @@ def fly_to(
 ) -> None:
     """
     Kombiniertes Manöver: takeoff → cruise → landing.
+    Steht das UFO bereits am Boden im Stoppfenster um (x, y) und liegt auch die
+    Zielhöhe `z` im vertikalen Stoppfenster, entfällt das Manöver (kein Auf-/Abstieg).
 
     Args:
         sim: Simulator.
@@ -362,7 +397,16 @@ def fly_to(
         z: Zielhöhe [m].
         cfg: Konfiguration.
     """
-    conf = replace(DEFAULT_CFG) if cfg is None else cfg
+    conf = DEFAULT_CFG if cfg is None else cfg
+
+    # Echter Leerlauf nur ohne Strecke UND ohne Höhe: ein Sprung auf z > stop_z
+    # am Startpunkt (z. B. (0, 0, 10)) ist ein gültiges Manöver
+    if (
+        abs(z) <= conf.stop_z
+        and sim.get_z() <= conf.stop_z
+        and hypot(x - sim.get_x(), y - sim.get_y()) <= conf.stop_h
+    ):
+        return
 
     _Autopilot.takeoff(sim, z, conf)
     _Autopilot.cruise(sim, x, y, conf)
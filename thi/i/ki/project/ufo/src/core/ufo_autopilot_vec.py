@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+"""
+UFO‑Autopilot: vektorisierte Geometrie für Stapelauswertungen.
+
+Inhalt
+- distance_v, angle_v, flight_distance_v
+
+Konventionen
+- Elementweise NumPy‑Varianten der Skalarfunktionen aus `ufo_autopilot`
+  (gleiche Definitionen, broadcast‑fähige Eingaben, Rückgabe als ndarray).
+- Für viele Kandidatenziele (Routen-/Flächenplanung) statt Python‑Schleifen.
+"""
+
+
+def distance_v(x1: ArrayLike, y1: ArrayLike, x2: ArrayLike, y2: ArrayLike) -> np.ndarray:
+    """
+    Euklidische Distanzen |P1P2| im xy‑Plan (elementweise).
+
+    Returns:
+        Array der Distanzen in den Einheiten der Eingaben.
+    """
+    return np.hypot(np.subtract(x2, x1), np.subtract(y2, y1))
+
+
+def angle_v(x1: ArrayLike, y1: ArrayLike, x2: ArrayLike, y2: ArrayLike) -> np.ndarray:
+    """
+    Absolutwinkel φ ∈ [0°, 360°) von P1→P2 relativ +x (elementweise).
+
+    Returns:
+        Array der Winkel in Grad; auf 360.0 gerundete Werte werden zu 0.0.
+    """
+    phi = np.mod(np.degrees(np.arctan2(np.subtract(y2, y1), np.subtract(x2, x1))), 360.0)
+    return np.where(phi == 360.0, 0.0, phi)
+
+
+def flight_distance_v(
+        x1: ArrayLike,
+        y1: ArrayLike,
+        x2: ArrayLike,
+        y2: ArrayLike,
+        z: ArrayLike,
+) -> np.ndarray:
+    """
+    Gesamtstrecken: horizontale Distanz + doppelter Höhenweg (elementweise).
+
+    Definition: hypot(Δx, Δy) + 2·|z|.
+    """
+    return distance_v(x1, y1, x2, y2) + 2.0 * np.abs(z)
+
+
+__all__ = ["distance_v", "angle_v", "flight_distance_v"]
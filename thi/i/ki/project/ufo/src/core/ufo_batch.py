@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+from functools import partial
+from multiprocessing import Pool
+from typing import Sequence
+
+from .ufosim3_2_9q import UfoSim
+from .ufo_autopilot import fly_to
+
+"""
+UFO‑Batch: parallele Parameterläufe (Survey‑Ensemble) ohne Ansicht.
+
+Inhalt
+- run_batch
+
+Konventionen
+- Ein Ziel ist ein Tripel (x, y, z) wie bei `fly_to`.
+- Jeder Lauf nutzt eine eigene `UfoSim`‑Instanz in einem eigenen Prozess;
+  die Läufe sind unabhängig, die Ergebnisreihenfolge entspricht den Zielen.
+- Ohne Ansicht: `scaling` außerhalb 1 … 100 startet den Sim ohne Tk‑Thread
+  (Tk ist nicht multiprozess‑fest) und ohne die 2‑s‑Wartezeit des View‑Starts.
+"""
+
+_OHNE_ANSICHT: int = 0  # ungültiges scaling → UfoSim startet ohne View
+
+
+def _einzelflug(ziel: tuple[float, float, float], speedup: int) -> float:
+    """
+    Ein Flug in frischem Simulator.
+
+    Returns:
+        Tatsächlich geflogene Distanz [m].
+    """
+    x, y, z = ziel
+    sim = UfoSim()
+    sim.start(speedup, _OHNE_ANSICHT, [])
+    try:
+        fly_to(sim, x, y, z)
+        return sim.get_dist()
+    finally:
+        sim.terminate()
+
+
+def run_batch(
+        targets: Sequence[tuple[float, float, float]],
+        *,
+        speedup: int = 25,
+        processes: int | None = None,
+) -> list[float]:
+    """
+    Fliegt alle Ziele parallel an (ein Prozess je Lauf, höchstens `processes` gleichzeitig).
+
+    Args:
+        targets: Ziele (x, y, z).
+        speedup: Echtzeitfaktor des Simulators (1 … 25).
+        processes: Anzahl Arbeitsprozesse. Standard: `os.cpu_count()`, höchstens `len(targets)`.
+
+    Returns:
+        Geflogene Distanzen [m] in Reihenfolge von `targets`.
+    """
+    ziele: list[tuple[float, float, float]] = [tuple(t) for t in targets]
+    if not ziele:
+        return []
+
+    anzahl: int = min(processes or os.cpu_count() or 1, len(ziele))
+    with Pool(anzahl) as pool:
+        return pool.map(partial(_einzelflug, speedup=speedup), ziele)
+
+
+__all__ = ["run_batch"]
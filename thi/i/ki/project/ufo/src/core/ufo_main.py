@@ -1,5 +1,4 @@
 # thi/i/ki/project/ufo/src/core/ufo_main.py
-from .ufosim3_2_9q import UfoSim
 from util.evaluation import read_input  # Fallback, falls util nicht installiert ist
 from .ufo_autopilot import flight_distance, fly_to
 import os
@@ -20,6 +19,9 @@ def main() -> None:
         # Nur Planung ausgeben, keine GUI/Simulation
         return
 
+    # Simulator (und damit tkinter) erst hier laden: der Headless-Pfad braucht ihn nicht
+    from .ufosim3_2_9q import UfoSim
+
     # Simulation starten (ganze Zahlen gefordert)
     sim = UfoSim()
     speedup: int = 5